@@ -15,11 +15,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ------------------------------------------------------------------------
+import concurrent.futures
+import functools
 import math
-import ntpath
 import os
 import pathlib
-from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import openslide
@@ -50,10 +51,22 @@ try:
 except (ModuleNotFoundError, ImportError):  # pragma: no cover
     LARGEIMAGE_IS_INSTALLED = False
 
+try:
+    import tifffile
+
+    TIFFFILE_IS_INSTALLED = True
+except (ModuleNotFoundError, ImportError):  # pragma: no cover
+    TIFFFILE_IS_INSTALLED = False
+
 IMG_EXT = "png"
 IMG_UPSAMPLE_MODE = PIL.Image.Resampling.BICUBIC
 IMG_DOWNSAMPLE_MODE = PIL.Image.Resampling.LANCZOS
 TILE_SIZE_PIXEL_TOLERANCE = 5
+RESAMPLE_TILE_SIZE = 4096
+# ---TIFF compressions decoded by tifffile without imagecodecs: none and deflate---
+TIFFFILE_COMPRESSIONS = (1, 8, 32946)
+# ---photometric tag value of RGB TIFFs: tifffile enums moved across its releases---
+TIFFFILE_PHOTOMETRIC_RGB = 2
 
 
 class Slide:
@@ -96,6 +109,7 @@ class Slide:
         use_largeimage: bool = False,
     ) -> None:
         self._path = str(path) if isinstance(path, pathlib.Path) else path
+        self._name = None
 
         if processed_path is None:
             raise TypeError("processed_path cannot be None.")
@@ -107,6 +121,14 @@ class Slide:
                 "https://github.com/girder/large_image for instructions."
             )
         self._use_largeimage = use_largeimage
+        self._wsi_handle = None
+        self._levels_dimensions_cache = None
+
+    def __enter__(self) -> "Slide":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def __repr__(self):
         return (
@@ -161,6 +183,15 @@ class Slide:
             "use_largeimage to True when instantiating this Slide."
         )
 
+    def close(self) -> None:
+        """Close the OpenSlide object backing the slide, if it was opened.
+
+        The slide is transparently re-opened on the next access requiring it.
+        """
+        if self._wsi_handle is not None:
+            self._wsi_handle.close()
+            self._wsi_handle = None
+
     @lazyproperty
     def dimensions(self) -> Tuple[int, int]:
         """Slide dimensions (w,h) at level 0.
@@ -287,11 +318,11 @@ class Slide:
         """
         level = level if level >= 0 else self._remap_level(level)
         try:
-            return self._wsi.level_dimensions[level]
+            return self._levels_dimensions[level]
         except IndexError:
             raise LevelError(
                 f"Level {level} not available. Number of available levels: "
-                f"{len(self._wsi.level_dimensions)}"
+                f"{len(self._levels_dimensions)}"
             )
 
     def level_magnification_factor(self, level: int = 0) -> str:
@@ -356,7 +387,7 @@ class Slide:
         List[int]
             The levels available
         """
-        return list(range(len(self._wsi.level_dimensions)))
+        return list(range(len(self._levels_dimensions)))
 
     def locate_mask(
         self,
@@ -389,7 +420,7 @@ class Slide:
         """
         img = self.scaled_image(scale_factor)
         mask = binary_mask(self)
-        resized_mask = np.array(
+        resized_mask = np.asarray(
             PIL.Image.fromarray(mask).resize(img.size, PIL.Image.Resampling.LANCZOS)
         )
 
@@ -413,7 +444,7 @@ class Slide:
 
         return img
 
-    @lazyproperty
+    @property
     def name(self) -> str:
         """Slide name without extension.
 
@@ -421,8 +452,10 @@ class Slide:
         -------
         name : str
         """
-        bname = ntpath.basename(self._path)
-        return bname[: bname.rfind(".")]
+        if self._name is None:
+            # ---PureWindowsPath handles both "/" and "\" separators on any OS---
+            self._name = pathlib.PureWindowsPath(self._path).stem
+        return self._name
 
     @lazyproperty
     def processed_path(self) -> str:
@@ -459,7 +492,9 @@ class Slide:
         resampled_array: np.ndarray
             Resampled array
         """
-        return self._resample(scale_factor)[1]
+        # ---np.asarray wraps the pixels PIL exports, while np.array would copy---
+        # ---them once more. The array is read-only: use np.array to modify it---
+        return np.asarray(self._resample(scale_factor), dtype=np.uint8)
 
     def scaled_image(self, scale_factor: int = 32) -> PIL.Image.Image:
         """Return a scaled image of the slide.
@@ -474,7 +509,7 @@ class Slide:
         PIL.Image.Image
             A scaled image of the slide.
         """
-        return self._resample(scale_factor)[0]
+        return self._resample(scale_factor)
 
     def show(self) -> None:
         """Display the slide thumbnail.
@@ -513,6 +548,36 @@ class Slide:
 
     # ------- implementation helpers -------
 
+    def _best_level_for_size(self, width: int, height: int) -> int:
+        """Return the smallest level whose dimensions are at least (width, height).
+
+        Reading from this level decodes the fewest pixels that can be downsampled
+        to the requested size without upsampling. When no level is large enough,
+        the highest resolution level, i.e. 0, is returned.
+
+        Parameters
+        ----------
+        width : int
+            Requested width
+        height : int
+            Requested height
+
+        Returns
+        -------
+        int
+            Level to read the slide from
+        """
+        levels_dimensions = self._levels_dimensions
+        return min(
+            (
+                level
+                for level, (level_w, level_h) in enumerate(levels_dimensions)
+                if level_w >= width and level_h >= height
+            ),
+            key=lambda level: levels_dimensions[level][0],
+            default=0,
+        )
+
     @staticmethod
     def _bytes2pil(bytesim: bytearray):
         """Convert a bytes image to a PIL image object.
@@ -551,6 +616,81 @@ class Slide:
             and 0 <= coords.y_br < self.dimensions[1]
         )
 
+    @staticmethod
+    def _is_integer_downsample(
+        src_size: Tuple[int, int], dst_size: Tuple[int, int]
+    ) -> bool:
+        """Check if ``src_size`` is an exact integer multiple of ``dst_size``.
+
+        Parameters
+        ----------
+        src_size : Tuple[int, int]
+            Size (width, height) of the image to downsample
+        dst_size : Tuple[int, int]
+            Size (width, height) of the downsampled image
+
+        Returns
+        -------
+        bool
+            True if both width and height are downsampled by an integer factor,
+            False otherwise
+        """
+        return all(
+            dst > 0 and src >= dst and src % dst == 0
+            for src, dst in zip(src_size, dst_size)
+        )
+
+    @lazyproperty
+    def _is_plain_tiff(self) -> bool:
+        """Whether the slide is a TIFF that OpenSlide reads only as a plain image.
+
+        OpenSlide does not recognize stripped or sub-IFD TIFF pyramids and opens them
+        with PIL, decoding the whole full resolution page. Such TIFFs are read with
+        ``tifffile`` instead, when it is installed and the slide holds uint8 RGB(A)
+        pixels with a compression ``tifffile`` can decode on its own. Other colour
+        spaces, e.g. CMYK or YCbCr, are left to PIL, which converts them to RGB.
+
+        Returns
+        -------
+        bool
+            True if the slide can be read with ``tifffile``, False otherwise
+        """
+        if (
+            not TIFFFILE_IS_INSTALLED
+            or os.path.splitext(self._path)[1].lower() not in (".tif", ".tiff")
+            or not isinstance(self._wsi, openslide.ImageSlide)
+        ):
+            return False
+        with tifffile.TiffFile(self._path) as tiff:
+            series = tiff.series[0]
+            return (
+                series.axes == "YXS"
+                and series.dtype == np.uint8
+                and series.shape[2] in (3, 4)
+                and int(series.keyframe.photometric) == TIFFFILE_PHOTOMETRIC_RGB
+                and all(
+                    level.keyframe.compression in TIFFFILE_COMPRESSIONS
+                    for level in getattr(series, "levels", [series])
+                )
+            )
+
+    @property
+    def _levels_dimensions(self) -> Tuple[Tuple[int, int], ...]:
+        """Dimensions (width, height) of each level of the slide.
+
+        OpenSlide rebuilds this tuple from the C library at each access of its
+        ``level_dimensions`` attribute, so it is read on first access and kept on
+        the slide, also after ``close()``.
+
+        Returns
+        -------
+        Tuple[Tuple[int, int], ...]
+            Dimensions of the slide levels, from level 0 to the lowest resolution
+        """
+        if self._levels_dimensions_cache is None:
+            self._levels_dimensions_cache = tuple(self._wsi.level_dimensions)
+        return self._levels_dimensions_cache
+
     @lazyproperty
     def _metadata(self) -> dict:
         """Get metadata about this slide, including magnification.
@@ -564,6 +704,100 @@ class Slide:
         """
         return self._tile_source.getMetadata()
 
+    def _open_wsi(self) -> Union[openslide.OpenSlide, openslide.ImageSlide]:
+        """Open the slide with openslide.
+
+        Returns
+        -------
+        slide : OpenSlide object
+            An OpenSlide object representing a whole-slide image.
+        """
+        bad_format_error = (
+            "This slide may be corrupted or have a non-standard format not "
+            "handled by the openslide and PIL libraries. Consider setting "
+            "use_largeimage to True when instantiating this Slide."
+        )
+        try:
+            slide = openslide.open_slide(self._path)
+        except PIL.UnidentifiedImageError:
+            raise PIL.UnidentifiedImageError(bad_format_error)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"The wsi path resource doesn't exist: {self._path}"
+            )
+        except Exception as other_error:
+            raise HistolabException(other_error.__repr__() + f". {bad_format_error}")
+        return slide
+
+    def _read_reduced_level(self, level: int, size: Tuple[int, int]) -> PIL.Image.Image:
+        """Read a level tile by tile, reducing each tile by block mean to ``size``.
+
+        Only a tile of at most ``RESAMPLE_TILE_SIZE`` x ``RESAMPLE_TILE_SIZE`` pixels
+        is decoded at a time, instead of the whole level. The dimensions of the level
+        must be integer multiples of ``size`` and its downsample factor an integer,
+        so that tiles map onto whole blocks of the output: the result is the same as
+        reducing the whole level at once.
+
+        Parameters
+        ----------
+        level : int
+            Level to read
+        size : Tuple[int, int]
+            Size (width, height) of the reduced image
+
+        Returns
+        -------
+        PIL.Image.Image
+            The reduced RGB image of the level
+        """
+        level_w, level_h = self._levels_dimensions[level]
+        factor_x, factor_y = level_w // size[0], level_h // size[1]
+        downsample = int(self._wsi.level_downsamples[level])
+        tile_w = factor_x * max(1, RESAMPLE_TILE_SIZE // factor_x)
+        tile_h = factor_y * max(1, RESAMPLE_TILE_SIZE // factor_y)
+        reduced = PIL.Image.new("RGB", size)
+        for y in range(0, level_h, tile_h):
+            for x in range(0, level_w, tile_w):
+                tile = self._wsi.read_region(
+                    (x * downsample, y * downsample),
+                    level,
+                    (min(tile_w, level_w - x), min(tile_h, level_h - y)),
+                ).convert("RGB")
+                reduced.paste(
+                    tile.reduce((factor_x, factor_y)), (x // factor_x, y // factor_y)
+                )
+        return reduced
+
+    def _read_tiff_level(self, width: int, height: int) -> PIL.Image.Image:
+        """Read the smallest level of a plain TIFF not below (width, height).
+
+        Parameters
+        ----------
+        width : int
+            Requested width
+        height : int
+            Requested height
+
+        Returns
+        -------
+        PIL.Image.Image
+            RGB image of the level. Level 0 is returned when no level is large enough.
+        """
+        with tifffile.TiffFile(self._path) as tiff:
+            series = tiff.series[0]
+            levels = getattr(series, "levels", [series])
+            level = min(
+                (
+                    level
+                    for level in levels
+                    if level.shape[1] >= width and level.shape[0] >= height
+                ),
+                key=lambda level: level.shape[1],
+                default=levels[0],
+            )
+            pixels = level.asarray()
+        return PIL.Image.fromarray(np.ascontiguousarray(pixels[..., :3]))
+
     def _remap_level(self, level: int) -> int:
         """Remap negative index for the given level onto a positive one.
 
@@ -585,17 +819,15 @@ class Slide:
         if len(self.levels) - abs(level) < 0:
             raise LevelError(
                 f"Level {level} not available. Number of available levels: "
-                f"{len(self._wsi.level_dimensions)}"
+                f"{len(self._levels_dimensions)}"
             )
         return len(self.levels) - abs(level)
 
-    def _resample(self, scale_factor: int = 32) -> Tuple[PIL.Image.Image, np.array]:
+    def _resample(self, scale_factor: int = 32) -> PIL.Image.Image:
         """Convert a slide to a scaled-down PIL image.
 
-        The PIL image is also converted to array.
-        image is the scaled-down PIL image, original width and original height
-        are the width and height of the slide, new width and new height are the
-        dimensions of the PIL image.
+        The image is not converted to array here, so that callers needing only the
+        PIL image do not pay for an extra copy of its pixels.
 
         Parameters
         ----------
@@ -606,12 +838,12 @@ class Slide:
         -------
         PIL.Image.Image
             The resampled image
-        np.ndarray
-            The resampled image converted to array
         """
 
         _, _, new_w, new_h = self._resampled_dimensions(scale_factor)
         if self._use_largeimage:
+            # ---without magnification, bound the output size so that large_image---
+            # ---reads the smallest sufficient level instead of the full resolution---
             kwargs = (
                 {
                     "scale": {
@@ -619,25 +851,36 @@ class Slide:
                     }
                 }
                 if self._metadata["magnification"] is not None
-                else {}
+                else {"output": {"maxWidth": new_w, "maxHeight": new_h}}
             )
             wsi_image, _ = self._tile_source.getRegion(
                 format=large_image.tilesource.TILE_FORMAT_PIL,
                 **kwargs,
             )
+        elif self._is_plain_tiff:
+            wsi_image = self._read_tiff_level(new_w, new_h)
         else:
-            level = self._wsi.get_best_level_for_downsample(scale_factor)
-            wsi_image = self._wsi.read_region(
-                (0, 0), level, self._wsi.level_dimensions[level]
+            level = self._best_level_for_size(new_w, new_h)
+            level_size = self._levels_dimensions[level]
+            # ---tiles map onto level 0 without subpixel offsets---
+            integer_level = float(self._wsi.level_downsamples[level]).is_integer()
+            new_size = (new_w, new_h)
+            if integer_level and self._is_integer_downsample(level_size, new_size):
+                return self._read_reduced_level(level, new_size)
+            wsi_image = self._wsi.read_region((0, 0), level, level_size)
+        # ---drop alpha before resampling: PIL premultiplies it for RGBA images,---
+        # ---which would alter the colours next to transparent (0, 0, 0, 0) areas---
+        if wsi_image.mode != "RGB":
+            wsi_image = wsi_image.convert("RGB")
+        if self._is_integer_downsample(wsi_image.size, (new_w, new_h)):
+            # ---block mean, equivalent to area averaging for integer factors---
+            return wsi_image.reduce(
+                (wsi_image.size[0] // new_w, wsi_image.size[1] // new_h)
             )
-        # ---converts openslide read_region to an actual RGBA image---
-        wsi_image = wsi_image.convert("RGB")
-        img = wsi_image.resize(
+        return wsi_image.resize(
             (new_w, new_h),
             IMG_UPSAMPLE_MODE if new_w >= wsi_image.size[0] else IMG_DOWNSAMPLE_MODE,
         )
-        arr_img = np.asarray(img)
-        return img, arr_img
 
     def _resampled_dimensions(
         self, scale_factor: int = 32
@@ -718,31 +961,21 @@ class Slide:
         source = large_image.getTileSource(self._path)
         return source
 
-    @lazyproperty
+    @property
     def _wsi(self) -> Union[openslide.OpenSlide, openslide.ImageSlide]:
         """Open the slide and returns an openslide object
 
+        The slide is opened on first access and the same object is returned until
+        ``close()`` is called.
+
         Returns
         -------
         slide : OpenSlide object
             An OpenSlide object representing a whole-slide image.
         """
-        bad_format_error = (
-            "This slide may be corrupted or have a non-standard format not "
-            "handled by the openslide and PIL libraries. Consider setting "
-            "use_largeimage to True when instantiating this Slide."
-        )
-        try:
-            slide = openslide.open_slide(self._path)
-        except PIL.UnidentifiedImageError:
-            raise PIL.UnidentifiedImageError(bad_format_error)
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"The wsi path resource doesn't exist: {self._path}"
-            )
-        except Exception as other_error:
-            raise HistolabException(other_error.__repr__() + f". {bad_format_error}")
-        return slide
+        if self._wsi_handle is None:
+            self._wsi_handle = self._open_wsi()
+        return self._wsi_handle
 
 
 class SlideSet:
@@ -769,27 +1002,11 @@ class SlideSet:
         -------
         generator of `Slide` objects.
         """
-        slide_names = [
-            name
-            for name in os.listdir(self._slides_path)
-            if (os.path.splitext(name)[1] in self._valid_extensions)
-        ]
-        if self._keep_slides is not None:
-            slide_names = [name for name in slide_names if name in self._keep_slides]
-        return iter(
-            [
-                Slide(
-                    os.path.join(self._slides_path, name),
-                    self._processed_path,
-                    **self._slide_kwargs,
-                )
-                for name in slide_names
-            ]
-        )
+        return iter(self._slides)
 
     def __getitem__(self, slide_id: int) -> Slide:
         """Slide object given the correspondent id"""
-        return list(self.__iter__())[slide_id]
+        return self._slides[slide_id]
 
     def __len__(self) -> int:
         """Total number of the slides of this Slideset
@@ -799,12 +1016,12 @@ class SlideSet:
         int
             number of the Slides.
         """
-        return len(list(self.__iter__()))
+        return len(self._slides)
 
     # ---public interface methods and properties---
 
     def scaled_images(
-        self, scale_factor: int = 32, n: int = 0
+        self, scale_factor: int = 32, n: int = 0, n_workers: Optional[int] = 1
     ) -> List[PIL.Image.Image]:
         """Return rescaled images of the slides.
 
@@ -815,6 +1032,10 @@ class SlideSet:
         n : int, optional
             First n slides in dataset folder to rescale. Default is 0, meaning that all
             the slides will be returned.
+        n_workers : int, optional
+            Number of processes rescaling the slides in parallel. If None, as many
+            processes as the machine's processors are used. Default is 1, meaning
+            that the slides are rescaled sequentially in the current process.
 
         Returns
         -------
@@ -822,12 +1043,22 @@ class SlideSet:
             List of rescaled images of the slides.
         """
         n = self.total_slides if (n > self.total_slides or n == 0) else n
+        slides = self._slides[:n]
+        if n_workers != 1:
+            return self._map_slides_in_processes(
+                functools.partial(_scaled_image, scale_factor=scale_factor),
+                slides,
+                n_workers,
+            )
         rescaled_imgs = []
-        for slide in list(self.__iter__())[:n]:
-            rescaled_imgs.append(slide.scaled_image(scale_factor))
+        for slide in slides:
+            with slide:
+                rescaled_imgs.append(slide.scaled_image(scale_factor))
         return rescaled_imgs
 
-    def thumbnails(self, n: int = 0) -> List[PIL.Image.Image]:
+    def thumbnails(
+        self, n: int = 0, n_workers: Optional[int] = 1
+    ) -> List[PIL.Image.Image]:
         """Return slides thumbnails
 
         Parameters
@@ -835,6 +1066,11 @@ class SlideSet:
         n : int, optional
             First n slides in dataset folder. Default is 0, meaning that the thumbnails
             of all the slides will be returned.
+        n_workers : int, optional
+            Number of processes computing the thumbnails in parallel. If None, as
+            many processes as the machine's processors are used. Default is 1,
+            meaning that the thumbnails are computed sequentially in the current
+            process.
 
         Returns
         -------
@@ -842,9 +1078,13 @@ class SlideSet:
             List of slides thumbnails
         """
         n = self.total_slides if (n > self.total_slides or n == 0) else n
+        slides = self._slides[:n]
+        if n_workers != 1:
+            return self._map_slides_in_processes(_thumbnail, slides, n_workers)
         thumbnails = []
-        for slide in list(self.__iter__())[:n]:
-            thumbnails.append(slide.thumbnail)
+        for slide in slides:
+            with slide:
+                thumbnails.append(slide.thumbnail)
         return thumbnails
 
     @lazyproperty
@@ -858,18 +1098,7 @@ class SlideSet:
         ----------
         basic_stats: dict of slides stats e.g. min_size, avg_size, etc...
         """
-        return {
-            "no_of_slides": self.total_slides,
-            "max_width": self._max_width_slide,
-            "max_height": self._max_height_slide,
-            "max_size": self._max_size_slide,
-            "min_width": self._min_width_slide,
-            "min_height": self._min_height_slide,
-            "min_size": self._min_size_slide,
-            "avg_width": self._avg_width_slide,
-            "avg_height": self._avg_height_slide,
-            "avg_size": self._avg_size_slide,
-        }
+        return {"no_of_slides": self.total_slides, **self._compute_stats()}
 
     @lazyproperty
     def total_slides(self) -> int:
@@ -884,60 +1113,130 @@ class SlideSet:
 
     # ---private interface methods and properties---
 
-    @lazyproperty
-    def _avg_width_slide(self) -> float:
-        return sum(d["width"] for d in self._slides_dimensions) / self.total_slides
+    def _compute_stats(self) -> dict:
+        """Compute the width/height/size statistics of the slides in a single pass.
 
-    @lazyproperty
-    def _avg_height_slide(self) -> float:
-        return sum(d["height"] for d in self._slides_dimensions) / self.total_slides
+        Returns
+        -------
+        dict
+            Slide with the maximum/minimum width, height and size and the average
+            width, height and size of the slides.
+        """
+        names = [slide.name for slide in self]
+        widths, heights = self._slides_dimensions_array.T
+        max_stats, min_stats, avg_stats = {}, {}, {}
+        for key, values in (
+            ("width", widths),
+            ("height", heights),
+            ("size", widths * heights),
+        ):
+            max_id, min_id = values.argmax(), values.argmin()
+            max_stats[f"max_{key}"] = {"slide": names[max_id], key: int(values[max_id])}
+            min_stats[f"min_{key}"] = {"slide": names[min_id], key: int(values[min_id])}
+            avg_stats[f"avg_{key}"] = float(values.mean())
+        return {**max_stats, **min_stats, **avg_stats}
 
-    @lazyproperty
-    def _avg_size_slide(self) -> float:
-        return sum(d["size"] for d in self._slides_dimensions) / self.total_slides
+    def _map_slides_in_processes(
+        self,
+        func: Callable[..., PIL.Image.Image],
+        slides: List[Slide],
+        n_workers: Optional[int],
+    ) -> List[PIL.Image.Image]:
+        """Apply ``func`` to each slide in a pool of processes.
 
-    @lazyproperty
-    def _max_height_slide(self) -> dict:
-        max_height = max(self._slides_dimensions, key=lambda x: x["height"])
-        return {"slide": max_height["slide"], "height": max_height["height"]}
+        OpenSlide objects cannot be pickled, hence ``func`` receives the path of the
+        slide and the slide is opened again in the worker process.
 
-    @lazyproperty
-    def _max_size_slide(self) -> dict:
-        max_size = max(self._slides_dimensions, key=lambda x: x["size"])
-        return {"slide": max_size["slide"], "size": max_size["size"]}
+        Parameters
+        ----------
+        func : Callable[..., PIL.Image.Image]
+            Module-level function accepting the slide path, the processed path and
+            the slide keyword arguments.
+        slides : List[Slide]
+            Slides to process
+        n_workers : Optional[int]
+            Number of worker processes. If None, as many processes as the machine's
+            processors are used.
 
-    @lazyproperty
-    def _max_width_slide(self) -> dict:
-        max_width = max(self._slides_dimensions, key=lambda x: x["width"])
-        return {"slide": max_width["slide"], "width": max_width["width"]}
+        Returns
+        -------
+        List[PIL.Image.Image]
+            Results of ``func``, in the same order of ``slides``.
+        """
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(
+                executor.map(
+                    functools.partial(
+                        func,
+                        processed_path=self._processed_path,
+                        slide_kwargs=self._slide_kwargs,
+                    ),
+                    [slide._path for slide in slides],
+                )
+            )
 
     @lazyproperty
-    def _min_width_slide(self) -> dict:
-        min_width = min(self._slides_dimensions, key=lambda x: x["width"])
-        return {"slide": min_width["slide"], "width": min_width["width"]}
+    def _slides(self) -> List[Slide]:
+        """List of the slides in the slideset, built once and then reused.
 
-    @lazyproperty
-    def _min_height_slide(self) -> dict:
-        min_height = min(self._slides_dimensions, key=lambda x: x["height"])
-        return {"slide": min_height["slide"], "height": min_height["height"]}
+        Returns
+        -------
+        List[Slide]
+            The `Slide` objects of the slideset.
+        """
+        slide_names = [
+            name
+            for name in os.listdir(self._slides_path)
+            if (os.path.splitext(name)[1] in self._valid_extensions)
+        ]
+        if self._keep_slides is not None:
+            slide_names = [name for name in slide_names if name in self._keep_slides]
+        return [
+            Slide(
+                os.path.join(self._slides_path, name),
+                self._processed_path,
+                **self._slide_kwargs,
+            )
+            for name in slide_names
+        ]
 
     @lazyproperty
-    def _min_size_slide(self) -> dict:
-        min_size = min(self._slides_dimensions, key=lambda x: x["size"])
-        return {"slide": min_size["slide"], "size": min_size["size"]}
+    def _slides_dimensions_array(self) -> np.ndarray:
+        """(width, height) of each slide, read once and kept as an int64 array.
 
-    @lazyproperty
-    def _slides_dimensions(self) -> List[dict]:
-        return [
-            {
-                "slide": slide.name,
-                "width": slide.dimensions[0],
-                "height": slide.dimensions[1],
-                "size": slide.dimensions[0] * slide.dimensions[1],
-            }
-            for slide in list(self.__iter__())
-        ]
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_slides, 2) holding width and height of each slide.
+        """
+        dimensions = np.empty((len(self), 2), dtype=np.int64)
+        for i, slide in enumerate(self):
+            with slide:
+                dimensions[i] = slide.dimensions
+        return dimensions
 
     @lazyproperty
     def _slides_dimensions_list(self):
-        return [slide.dimensions for slide in list(self.__iter__())]
+        return [tuple(dims) for dims in self._slides_dimensions_array.tolist()]
+
+
+def _scaled_image(
+    slide_path: str, processed_path: str, slide_kwargs: dict, scale_factor: int
+) -> PIL.Image.Image:
+    """Open the slide at ``slide_path`` and return its rescaled image.
+
+    Used by ``SlideSet.scaled_images`` in worker processes.
+    """
+    with Slide(slide_path, processed_path, **slide_kwargs) as slide:
+        return slide.scaled_image(scale_factor)
+
+
+def _thumbnail(
+    slide_path: str, processed_path: str, slide_kwargs: dict
+) -> PIL.Image.Image:
+    """Open the slide at ``slide_path`` and return its thumbnail.
+
+    Used by ``SlideSet.thumbnails`` in worker processes.
+    """
+    with Slide(slide_path, processed_path, **slide_kwargs) as slide:
+        return slide.thumbnail
@@ -28,6 +28,8 @@ from .filters.compositions import FiltersComposition
 from .types import CoordinatePair
 from .util import lazyproperty
 
+PNG_COMPRESS_LEVEL = 1
+
 
 class Tile:
     """Provide Tile object representing a tile generated from a Slide object.
@@ -146,25 +148,45 @@ class Tile:
         """
         return self._level
 
-    def save(self, path: Union[str, bytes, os.PathLike]) -> None:
+    def save(
+        self,
+        path: Union[str, bytes, os.PathLike],
+        mkdir: bool = True,
+        compress_level: int = PNG_COMPRESS_LEVEL,
+    ) -> None:
         """Save tile at given path.
 
         The format to use is determined from the filename extension (to be compatible to
         PIL.Image formats). If no extension is provided, the image will be saved in png
-        format.
+        format. PNG files are written by default with a ``PNG_COMPRESS_LEVEL`` zlib
+        compression, which is much faster to encode than the default level of PIL for
+        slightly larger files.
 
         Parameters
         ---------
         path: str or pathlib.Path
             Path to which the tile is saved.
+        mkdir: bool, optional
+            Whether to create the missing parent directories of ``path``. Callers
+            saving many tiles in the same directory can create it once and pass
+            False. Default is True.
+        compress_level: int, optional
+            zlib compression level, between 0 and 9, of PNG files. It is ignored for
+            the other formats. Pass 6, the default level of PIL, to get smaller files
+            at the cost of a slower encoding. Default is ``PNG_COMPRESS_LEVEL``.
 
         """
         ext = os.path.splitext(path)[1]
         if not ext:
-            path = f"{path}.png"
+            ext = ".png"
+            path = f"{path}{ext}"
 
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
-        self._image.save(path)
+        save_kwargs = (
+            {"compress_level": compress_level} if ext.lower() == ".png" else {}
+        )
+        if mkdir:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._image.save(path, **save_kwargs)
 
     @lazyproperty
     def tissue_mask(self) -> np.ndarray:
@@ -158,6 +158,18 @@ class Tiler(Protocol):
             and self.tile_size[1] <= slide.level_dimensions(self.level)[1]
         )
 
+    def _make_tiles_dir(self, slide: Slide) -> None:
+        """Create the directory where the tiles of ``slide`` are saved, if missing.
+
+        Parameters
+        ----------
+        slide : Slide
+            The slide the tiles are extracted from
+        """
+        tiles_dirpath = os.path.dirname(os.path.join(slide.processed_path, self.prefix))
+        if tiles_dirpath:
+            os.makedirs(tiles_dirpath, exist_ok=True)
+
     def _scale_factor(self, slide: Slide) -> float:
         """Retrieve the scale factor that maps the original tile_size to proper one.
 
@@ -387,11 +399,12 @@ class GridTiler(Tiler):
         self._validate_tile_size(slide)
 
         grid_tiles = self._tiles_generator(slide, extraction_mask)
+        self._make_tiles_dir(slide)
         tiles_counter = 0
         for tiles_counter, (tile, tile_wsi_coords) in enumerate(grid_tiles):
             tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
             full_tile_path = os.path.join(slide.processed_path, tile_filename)
-            tile.save(full_tile_path)
+            tile.save(full_tile_path, mkdir=False)
             logger.info(f"\t Tile {tiles_counter} saved: {tile_filename}")
         logger.info(f"{tiles_counter} Grid Tiles have been saved.")
 
@@ -711,11 +724,12 @@ class RandomTiler(Tiler):
 
         random_tiles = self._tiles_generator(slide, extraction_mask)
 
+        self._make_tiles_dir(slide)
         tiles_counter = 0
         for tiles_counter, (tile, tile_wsi_coords) in enumerate(random_tiles):
             tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
             full_tile_path = os.path.join(slide.processed_path, tile_filename)
-            tile.save(full_tile_path)
+            tile.save(full_tile_path, mkdir=False)
             logger.info(f"\t Tile {tiles_counter} saved: {tile_filename}")
         logger.info(f"{tiles_counter+1} Random Tiles have been saved.")
 
@@ -945,6 +959,7 @@ class ScoreTiler(GridTiler):
             slide, extraction_mask
         )
 
+        self._make_tiles_dir(slide)
         tiles_counter = 0
         filenames = []
 
@@ -956,7 +971,7 @@ class ScoreTiler(GridTiler):
                 level=self.level if self.mpp is None else None,
             )
             tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
-            tile.save(os.path.join(slide.processed_path, tile_filename))
+            tile.save(os.path.join(slide.processed_path, tile_filename), mkdir=False)
             filenames.append(tile_filename)
             logger.info(
                 f"\t Tile {tiles_counter} - score: {score} saved: {tile_filename}"
@@ -39,7 +39,6 @@ from ..unitutil import (
     base_test_slide,
     call,
     class_mock,
-    dict_list_eq,
     initializer_mock,
     instance_mock,
     is_win32,
@@ -109,6 +108,8 @@ class Describe_Slide:
             ("/foo/bar/myslide.svs", "myslide"),
             ("/foo/myslide.svs", "myslide"),
             ("/foo/name.has.dot.svs", "name.has.dot"),
+            ("/foo/bar/myslide", "myslide"),
+            ("C:\\foo\\bar\\myslide.svs", "myslide"),
         ),
     )
     def it_knows_its_name(self, slide_path, expected_value):
@@ -285,6 +286,31 @@ class Describe_Slide:
 
         assert type(_wsi) in (openslide.OpenSlide, openslide.ImageSlide)
 
+    def it_opens_its_wsi_only_once(self, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_50X50_155_0_0)
+
+        _wsi = slide._wsi
+
+        assert slide._wsi is _wsi
+
+    def it_can_close_its_wsi(self, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_50X50_155_0_0)
+        _wsi = slide._wsi
+
+        slide.close()
+
+        assert slide._wsi_handle is None
+        assert slide._wsi is not _wsi
+
+    def it_closes_its_wsi_when_used_as_a_context_manager(self, request, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_50X50_155_0_0)
+        close_ = method_mock(request, Slide, "close")
+
+        with slide as s:
+            assert s is slide
+
+        close_.assert_called_once_with(slide)
+
     def but_it_raises_an_exception_if_file_not_found(self):
         with pytest.raises(FileNotFoundError) as err:
             slide = Slide("wrong/path/fake.wsi", "processed")
@@ -317,25 +343,56 @@ class Describe_Slide:
         resampled_dims_.return_value = (100, 200, 300, 400)
 
         _resample = slide._resample(32)
+        _resample_array = np.asarray(_resample)
 
         # image array assertions
-        assert type(_resample[1]) == np.ndarray
         # ---The np array shape should be (new_h X new_w X channels),---
         # ---in this case (look at resampled_dims mock) the new_h is 400---
         # ---the new_w is 300 and the color channels of the image are 3---
-        assert _resample[1].shape == (400, 300, 3)
+        assert _resample_array.shape == (400, 300, 3)
         # ---Here we prove that the 3 channels are compliant with the color---
         # ---definition and that each channel is a np.array (400x300) filled---
         # ---with the related color expressed during the image creation---
-        np.testing.assert_almost_equal(_resample[1][:, :, 0], np.full((400, 300), 155))
-        np.testing.assert_almost_equal(_resample[1][:, :, 1], np.full((400, 300), 249))
-        np.testing.assert_almost_equal(_resample[1][:, :, 2], np.full((400, 300), 240))
+        np.testing.assert_almost_equal(
+            _resample_array[:, :, 0], np.full((400, 300), 155)
+        )
+        np.testing.assert_almost_equal(
+            _resample_array[:, :, 1], np.full((400, 300), 249)
+        )
+        np.testing.assert_almost_equal(
+            _resample_array[:, :, 2], np.full((400, 300), 240)
+        )
         # PIL image assertions
-        assert type(_resample[0]) == PIL.Image.Image
-        assert _resample[0].size == (300, 400)
-        assert _resample[0].width == 300
-        assert _resample[0].height == 400
-        assert _resample[0].mode == "RGB"
+        assert type(_resample) == PIL.Image.Image
+        assert _resample.size == (300, 400)
+        assert _resample.width == 300
+        assert _resample.height == 400
+        assert _resample.mode == "RGB"
+
+    @pytest.mark.parametrize(
+        "magnification, expected_kwargs",
+        (
+            (40, {"scale": {"magnification": 1.25}}),
+            (None, {"output": {"maxWidth": 300, "maxHeight": 400}}),
+        ),
+    )
+    def it_resamples_with_large_image_from_a_bounded_region(
+        self, request, resampled_dims_, magnification, expected_kwargs
+    ):
+        resampled_dims_.return_value = (100, 200, 300, 400)
+        property_mock(
+            request, Slide, "_metadata", return_value={"magnification": magnification}
+        )
+        _tile_source = property_mock(request, Slide, "_tile_source")
+        getRegion = _tile_source.return_value.getRegion
+        getRegion.return_value = (PILIMG.RGBA_COLOR_500X500_155_249_240, None)
+        slide = Slide("/a/b/foo", "processed", use_largeimage=True)
+
+        slide._resample(32)
+
+        getRegion.assert_called_once_with(
+            format=large_image.tilesource.TILE_FORMAT_PIL, **expected_kwargs
+        )
 
     def it_resamples_with_the_correct_scale_factor(self, tmpdir, resampled_dims_):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
@@ -343,7 +400,143 @@ class Describe_Slide:
 
         _resample = slide._resample(32)
 
-        assert _resample[1].shape == (math.floor(500 / 32), math.floor(500 / 32), 3)
+        assert _resample.size == (math.floor(500 / 32), math.floor(500 / 32))
+
+    @pytest.mark.parametrize(
+        "width, height, expected_level",
+        (
+            (1000, 500, 0),
+            (250, 125, 1),
+            (249, 125, 1),
+            (62, 31, 2),
+            (60, 25, 2),
+            (2000, 1000, 0),
+        ),
+    )
+    def it_knows_the_best_level_for_a_given_size(
+        self, request, width, height, expected_level
+    ):
+        _wsi = property_mock(request, Slide, "_wsi")
+        _wsi.return_value.level_dimensions = ((1000, 500), (250, 125), (62, 31))
+        slide = Slide("/a/b/foo", "processed")
+
+        level = slide._best_level_for_size(width, height)
+
+        assert level == expected_level
+
+    def it_reads_the_levels_dimensions_from_the_wsi_once(self, request, tmpdir):
+        level_dimensions_ = property_mock(
+            request,
+            openslide.ImageSlide,
+            "level_dimensions",
+            return_value=((1000, 500), (250, 125)),
+        )
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+
+        levels = slide.levels
+        slide.close()
+        level_dimensions = slide.level_dimensions(level=1)
+        level = slide._best_level_for_size(200, 100)
+
+        level_dimensions_.assert_called_once_with()
+        assert slide._wsi_handle is None
+        assert levels == [0, 1]
+        assert level_dimensions == (250, 125)
+        assert level == 1
+
+    def it_resamples_with_a_box_filter_for_integer_factors(
+        self, tmpdir, resampled_dims_
+    ):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        resampled_dims_.return_value = (500, 500, 100, 125)
+
+        _resample = slide._resample(32)
+
+        assert _resample.size == (100, 125)
+        np.testing.assert_array_equal(
+            _resample,
+            PILIMG.RGBA_COLOR_500X500_155_249_240.convert("RGB").reduce((5, 4)),
+        )
+
+    def it_reduces_its_level_tile_by_tile(self, tmpdir, monkeypatch):
+        image = PIL.Image.fromarray(
+            np.random.RandomState(0).randint(0, 256, (500, 500, 3), dtype=np.uint8)
+        )
+        slide, _ = base_test_slide(tmpdir, image)
+        monkeypatch.setattr("histolab.slide.RESAMPLE_TILE_SIZE", 64)
+
+        reduced = slide._read_reduced_level(0, (100, 125))
+
+        assert reduced.size == (100, 125)
+        np.testing.assert_array_equal(reduced, image.reduce((5, 4)))
+
+    def it_drops_the_alpha_channel_before_reducing(self, tmpdir):
+        pixels = np.random.RandomState(0).randint(0, 256, (500, 500, 4), dtype=np.uint8)
+        pixels[::3, ::2] = 0
+        image = PIL.Image.fromarray(pixels, "RGBA")
+        slide, _ = base_test_slide(tmpdir, image)
+
+        reduced = slide._read_reduced_level(0, (100, 125))
+
+        np.testing.assert_array_equal(reduced, image.convert("RGB").reduce((5, 4)))
+
+    @pytest.mark.parametrize(
+        "filename, compression, expected_value",
+        (
+            ("mywsi.tif", None, True),
+            ("mywsi.TIFF", "tiff_adobe_deflate", True),
+            ("mywsi.tif", "tiff_lzw", False),
+            ("mywsi.svs", None, False),
+        ),
+    )
+    def it_knows_if_it_is_a_plain_tiff(
+        self, tmpdir, filename, compression, expected_value
+    ):
+        pytest.importorskip("tifffile")
+        slide_path = os.path.join(tmpdir.mkdir("myslide"), filename)
+        image = PILIMG.RGB_RANDOM_COLOR_500X500
+        image.save(slide_path, "TIFF", compression=compression)
+        slide = Slide(slide_path, "processed")
+
+        assert slide._is_plain_tiff is expected_value
+
+    @pytest.mark.parametrize("mode", ("CMYK", "YCbCr"))
+    def but_it_leaves_non_rgb_tiffs_to_pil(self, tmpdir, mode):
+        pytest.importorskip("tifffile")
+        slide_path = os.path.join(tmpdir.mkdir("myslide"), "mywsi.tif")
+        PILIMG.RGB_RANDOM_COLOR_500X500.convert(mode).save(slide_path, "TIFF")
+        slide = Slide(slide_path, "processed")
+
+        assert slide._is_plain_tiff is False
+
+    def it_reads_the_smallest_sufficient_level_of_a_tiff_pyramid(self, tmpdir):
+        tifffile = pytest.importorskip("tifffile")
+        slide_path = os.path.join(tmpdir.mkdir("myslide"), "mywsi.tif")
+        level_0 = np.random.RandomState(0).randint(0, 256, (400, 600, 3), np.uint8)
+        level_1 = np.random.RandomState(1).randint(0, 256, (100, 150, 3), np.uint8)
+        with tifffile.TiffWriter(slide_path) as tiff:
+            tiff.write(level_0, photometric="rgb", subifds=1)
+            tiff.write(level_1, photometric="rgb", subfiletype=1)
+        slide = Slide(slide_path, "processed")
+
+        np.testing.assert_array_equal(slide._read_tiff_level(150, 80), level_1)
+        np.testing.assert_array_equal(slide._read_tiff_level(151, 80), level_0)
+        np.testing.assert_array_equal(slide._read_tiff_level(1000, 80), level_0)
+
+    @pytest.mark.parametrize(
+        "src_size, dst_size, expected_value",
+        (
+            ((500, 500), (100, 125), True),
+            ((500, 500), (500, 500), True),
+            ((500, 500), (300, 400), False),
+            ((500, 500), (100, 0), False),
+            ((500, 500), (1000, 500), False),
+        ),
+    )
+    def it_knows_if_a_downsample_is_by_integer_factors(
+        self, src_size, dst_size, expected_value
+    ):
+        assert Slide._is_integer_downsample(src_size, dst_size) is expected_value
 
     def it_knows_its_scaled_image(self, tmpdir, resampled_dims_):
         tmp_path_ = tmpdir.mkdir("myslide")
@@ -677,6 +870,21 @@ class Describe_Slideset:
         assert isinstance(err.value, FileNotFoundError)
         assert err.value.errno == errno.ENOENT
 
+    def it_lists_its_slides_only_once(self, request, tmpdir):
+        tmp_path_ = tmpdir.mkdir("myslide")
+        image = PILIMG.RGBA_COLOR_500X500_155_249_240
+        image.save(os.path.join(tmp_path_, "mywsi1.svs"), "TIFF")
+        image.save(os.path.join(tmp_path_, "mywsi2.svs"), "TIFF")
+        listdir_ = method_mock(request, os, "listdir", autospec=False)
+        listdir_.return_value = ["mywsi1.svs", "mywsi2.svs"]
+        slideset = SlideSet(tmp_path_, "proc", [".svs"])
+
+        slides = list(slideset)
+
+        assert len(slideset) == 2
+        assert slideset[1] is slides[1]
+        listdir_.assert_called_once_with(tmp_path_)
+
     @pytest.mark.parametrize("slide_kwargs", (({"use_largeimage": True}), ({})))
     def it_creates_its_slides_with_the_correct_parameters(
         self, tmpdir, request, slide_kwargs
@@ -733,22 +941,6 @@ class Describe_Slideset:
                 slide.resampled_array(), expected_slides[i].resampled_array()
             )
 
-    def it_knows_the_slides_dimensions(self, tmpdir):
-        tmp_path_ = tmpdir.mkdir("myslide")
-        image = PILIMG.RGBA_COLOR_500X500_155_249_240
-        image.save(os.path.join(tmp_path_, "mywsi.svs"), "TIFF")
-        image2 = PILIMG.RGBA_COLOR_50X50_155_0_0
-        image2.save(os.path.join(tmp_path_, "mywsi2.svs"), "TIFF")
-        slideset = SlideSet(tmp_path_, "proc", [".svs"])
-
-        slides_dimensions = slideset._slides_dimensions
-
-        expected_value = [
-            {"slide": "mywsi", "width": 500, "height": 500, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
-        assert dict_list_eq(slides_dimensions, expected_value) is True
-
     def it_knows_its_slides_dimensions_list(self, tmpdir):
         tmp_path_ = tmpdir.mkdir("myslide")
         image = PILIMG.RGBA_COLOR_500X500_155_249_240
@@ -762,7 +954,7 @@ class Describe_Slideset:
         assert sorted(_slides_dimensions_list) == sorted([(500, 500), (50, 50)])
 
     def it_knows_its_total_slides(self, request, Slide_):
-        slides = method_mock(request, SlideSet, "__iter__")
+        slides = property_mock(request, SlideSet, "_slides")
         slides.return_value = [Slide_ for _ in range(4)]
         slideset = SlideSet("the/path", "proc", [".svs"])
 
@@ -770,119 +962,44 @@ class Describe_Slideset:
 
         assert total_slides == 4
 
-    def it_knows_its_avg_width_slide(self, _slides_dimensions_prop, total_slides_prop):
-        total_slides_prop.return_value = 2
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 500, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _avg_width_slide = slideset._avg_width_slide
-
-        assert _avg_width_slide == 275.0
-        assert (
-            _avg_width_slide
-            == sum(d["width"] for d in _slides_dimensions_prop.return_value) / 2
-        )
-
-    def it_knows_its_avg_height_slide(self, _slides_dimensions_prop, total_slides_prop):
-        total_slides_prop.return_value = 2
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
+    def it_knows_its_slides_dimensions_array(self, request):
+        slide1 = instance_mock(request, Slide, name="slide1")
+        slide1.dimensions = (500, 100)
+        slide2 = instance_mock(request, Slide, name="slide2")
+        slide2.dimensions = (600, 50)
+        property_mock(request, SlideSet, "_slides", return_value=[slide1, slide2])
         slideset = SlideSet("fake/path", "proc", [".svs"])
 
-        _avg_height_slide = slideset._avg_height_slide
+        _slides_dimensions_array = slideset._slides_dimensions_array
 
-        assert _avg_height_slide == 75.0
-        assert (
-            _avg_height_slide
-            == sum(d["height"] for d in _slides_dimensions_prop.return_value) / 2
+        assert _slides_dimensions_array.dtype == np.int64
+        np.testing.assert_array_equal(
+            _slides_dimensions_array, np.array([[500, 100], [600, 50]])
         )
 
-    def it_knows_its_avg_size_slide(self, _slides_dimensions_prop, total_slides_prop):
-        total_slides_prop.return_value = 2
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _avg_size_slide = slideset._avg_size_slide
-
-        assert _avg_size_slide == 126250.0
-        assert (
-            _avg_size_slide
-            == sum(d["size"] for d in _slides_dimensions_prop.return_value) / 2
-        )
-
-    def it_knows_its_max_height_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _max_height_slide = slideset._max_height_slide
-
-        assert _max_height_slide == {"slide": "mywsi", "height": 100}
-
-    def it_knows_its_max_size_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 50, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _max_size_slide = slideset._max_size_slide
-
-        assert _max_size_slide == {"slide": "mywsi", "size": 250000}
-
-    def it_knows_its_max_width_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 600, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _max_width_slide = slideset._max_width_slide
-
-        assert _max_width_slide == {"slide": "mywsi2", "width": 600}
-
-    def it_knows_its_min_width_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 600, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _min_width_slide = slideset._min_width_slide
-
-        assert _min_width_slide == {"slide": "mywsi", "width": 500}
-
-    def it_knows_its_min_height_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 600, "height": 50, "size": 2500},
-        ]
-        slideset = SlideSet("fake/path", "proc", [".svs"])
-
-        _min_height_slide = slideset._min_height_slide
-
-        assert _min_height_slide == {"slide": "mywsi2", "height": 50}
-
-    def it_knows_its_min_size_slide(self, _slides_dimensions_prop):
-        _slides_dimensions_prop.return_value = [
-            {"slide": "mywsi", "width": 500, "height": 100, "size": 250000},
-            {"slide": "mywsi2", "width": 600, "height": 50, "size": 2500},
-        ]
+    def it_computes_its_stats(self, request, _slides_dimensions_array_prop):
+        slide1 = instance_mock(request, Slide, name="slide1")
+        slide1.name = "mywsi"
+        slide2 = instance_mock(request, Slide, name="slide2")
+        slide2.name = "mywsi2"
+        slides = method_mock(request, SlideSet, "__iter__")
+        slides.return_value = iter([slide1, slide2])
+        _slides_dimensions_array_prop.return_value = np.array([[500, 100], [600, 50]])
         slideset = SlideSet("fake/path", "proc", [".svs"])
 
-        _min_size_slide = slideset._min_size_slide
+        stats = slideset._compute_stats()
 
-        assert _min_size_slide == {"slide": "mywsi2", "size": 2500}
+        assert stats == {
+            "max_width": {"slide": "mywsi2", "width": 600},
+            "max_height": {"slide": "mywsi", "height": 100},
+            "max_size": {"slide": "mywsi", "size": 50000},
+            "min_width": {"slide": "mywsi", "width": 500},
+            "min_height": {"slide": "mywsi2", "height": 50},
+            "min_size": {"slide": "mywsi2", "size": 30000},
+            "avg_width": 550.0,
+            "avg_height": 75.0,
+            "avg_size": 40000.0,
+        }
 
     def it_knows_its_scaled_slides(self, request, tmpdir):
         tmp_path_ = tmpdir.mkdir("myslide")
@@ -890,7 +1007,7 @@ class Describe_Slideset:
         slide2 = instance_mock(request, Slide)
 
         slideset = SlideSet(tmp_path_, os.path.join(tmp_path_, "processed"), [])
-        slides = method_mock(request, SlideSet, "__iter__")
+        slides = property_mock(request, SlideSet, "_slides")
         slides.return_value = [slide1, slide2]
         slideset.scaled_images(32, 2)
 
@@ -904,13 +1021,43 @@ class Describe_Slideset:
         slide2 = Slide("foo/bar", "proc")
 
         slideset = SlideSet(tmp_path_, os.path.join(tmp_path_, "processed"), [])
-        slides = method_mock(request, SlideSet, "__iter__")
+        slides = property_mock(request, SlideSet, "_slides")
         slides.return_value = [slide1, slide2]
 
         slideset.thumbnails()
 
         assert thumbnail_.call_args_list == [call(), call()]
 
+    def it_closes_its_slides_after_using_them(self, tmpdir):
+        tmp_path_ = tmpdir.mkdir("myslide")
+        image = PILIMG.RGBA_COLOR_500X500_155_249_240
+        image.save(os.path.join(tmp_path_, "mywsi.svs"), "TIFF")
+        image.save(os.path.join(tmp_path_, "mywsi2.svs"), "TIFF")
+        slideset = SlideSet(tmp_path_, os.path.join(tmp_path_, "processed"), [".svs"])
+
+        slideset.scaled_images()
+        slideset.thumbnails()
+        slideset.slides_stats
+
+        assert all(slide._wsi_handle is None for slide in slideset)
+
+    def it_can_rescale_and_thumbnail_its_slides_in_parallel(self, tmpdir):
+        tmp_path_ = tmpdir.mkdir("myslide")
+        image = PILIMG.RGBA_COLOR_500X500_155_249_240
+        image.save(os.path.join(tmp_path_, "mywsi.svs"), "TIFF")
+        image2 = PILIMG.RGB_RANDOM_COLOR_500X500
+        image2.save(os.path.join(tmp_path_, "mywsi2.svs"), "TIFF")
+        slideset = SlideSet(tmp_path_, os.path.join(tmp_path_, "processed"), [".svs"])
+
+        scaled_images = slideset.scaled_images(16, n_workers=2)
+        thumbnails = slideset.thumbnails(n_workers=2)
+
+        assert len(scaled_images) == len(thumbnails) == 2
+        for parallel, sequential in zip(scaled_images, slideset.scaled_images(16)):
+            np.testing.assert_array_equal(parallel, sequential)
+        for parallel, sequential in zip(thumbnails, slideset.thumbnails()):
+            np.testing.assert_array_equal(parallel, sequential)
+
     def it_generates_slides_stats(self, total_slides_prop, tmpdir):
         total_slides_prop.return_value = 2
         tmp_path_ = tmpdir.mkdir("myslide")
@@ -938,8 +1085,8 @@ class Describe_Slideset:
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def _slides_dimensions_prop(self, request):
-        return property_mock(request, SlideSet, "_slides_dimensions")
+    def _slides_dimensions_array_prop(self, request):
+        return property_mock(request, SlideSet, "_slides_dimensions_array")
 
     @pytest.fixture
     def total_slides_prop(self, request):
@@ -19,6 +19,7 @@
 import os
 
 import numpy as np
+import PIL
 import pytest
 
 from histolab.filters.compositions import _TileFiltersComposition
@@ -32,6 +33,7 @@ from ..unitutil import (
     PILIMG,
     class_mock,
     initializer_mock,
+    instance_mock,
     method_mock,
     property_mock,
 )
@@ -98,6 +100,51 @@ class Describe_Tile:
 
         assert os.path.exists(tmp_path_)
 
+    def but_it_does_not_create_the_parent_directory_if_told_not_to(self, tmpdir):
+        tmp_path_ = os.path.join(tmpdir, "missing", "mytile.png")
+        tile = Tile(PILIMG.RGBA_COLOR_50X50_155_0_0, None, 0)
+
+        with pytest.raises(FileNotFoundError):
+            tile.save(tmp_path_, mkdir=False)
+
+    @pytest.mark.parametrize(
+        "filename, expected_kwargs",
+        (
+            ("mytile.png", {"compress_level": 1}),
+            ("mytile.PNG", {"compress_level": 1}),
+            ("mytile", {"compress_level": 1}),
+            ("mytile.jpg", {}),
+        ),
+    )
+    def it_saves_png_tiles_with_a_fast_compression(
+        self, request, tmpdir, filename, expected_kwargs
+    ):
+        tmp_path_ = os.path.join(tmpdir.mkdir("mydir"), filename)
+        _image = instance_mock(request, PIL.Image.Image)
+        tile = Tile(_image, None, 0)
+
+        tile.save(tmp_path_)
+
+        _image.save.assert_called_once_with(
+            tmp_path_ if os.path.splitext(filename)[1] else f"{tmp_path_}.png",
+            **expected_kwargs,
+        )
+
+    @pytest.mark.parametrize(
+        "filename, expected_kwargs",
+        (("mytile.png", {"compress_level": 6}), ("mytile.jpg", {})),
+    )
+    def and_it_can_save_png_tiles_with_another_compression(
+        self, request, tmpdir, filename, expected_kwargs
+    ):
+        tmp_path_ = os.path.join(tmpdir.mkdir("mydir"), filename)
+        _image = instance_mock(request, PIL.Image.Image)
+        tile = Tile(_image, None, 0)
+
+        tile.save(tmp_path_, compress_level=6)
+
+        _image.save.assert_called_once_with(tmp_path_, **expected_kwargs)
+
     def and_it_can_save_the_tile_image_also_without_ext(self, tmpdir):
         tmp_path_ = os.path.join(tmpdir.mkdir("mydir"), "mytile")
         _image = PILIMG.RGBA_COLOR_50X50_155_0_0
@@ -803,6 +803,21 @@ class Describe_GridTiler:
         )
         _has_valid_tile_size.assert_called_once_with(grid_tiler, slide)
 
+    @pytest.mark.parametrize(
+        "prefix, expected_dir",
+        (("", "processed"), ("grid", "processed"), ("sub/dir/", "processed/sub/dir")),
+    )
+    def it_creates_the_tiles_directory_once(self, tmpdir, prefix, expected_dir):
+        tmp_path_ = tmpdir.mkdir("myslide")
+        slide = Slide(
+            os.path.join(tmp_path_, "mywsi.png"), os.path.join(tmp_path_, "processed")
+        )
+        grid_tiler = GridTiler((10, 10), prefix=prefix)
+
+        grid_tiler._make_tiles_dir(slide)
+
+        assert os.path.isdir(os.path.join(tmp_path_, expected_dir))
+
     @pytest.mark.parametrize(
         "tile_coords, expected_result",
         [